@@ -2,64 +2,110 @@
 """
 import matplotlib.pyplot as plt
 
+import numpy as np
+
 import pandas as pd
 
 from typing import List
 
-from pandas.io.sas.sas_constants import text_block_size_length
+# Below this many rows the NumPy path beats numba's JIT compile and thread start-up
+_NUMBA_MIN_ROWS: int = 100_000
 
 
-def _has_qualifying_year(
-        row: pd.Series,
-        percentile_threshold: float,
-        snap_cols: List[str]
-) -> bool:
-    """Helper function to count years above percentile threshold.
+def _any_above_numpy(
+        snaps: np.ndarray,
+        threshold: float
+) -> np.ndarray:
+    """Flag rows with at least one value above threshold with NumPy.
 
-    :param row: a row from the DataFrame containing snap counts
-    :param percentile_threshold: minimum value to include
-    ":param snap_cols: List of column names to include
-    :return int: number of years above percentile
+    :param snaps: 2D array of snap counts (players x years)
+    :param threshold: minimum value to exceed
+    :return: boolean array with one entry per row
+    """
+    return (snaps > threshold).any(axis=1)
+
+
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _any_above_numba(
+            snaps: np.ndarray,
+            threshold: float
+    ) -> np.ndarray:
+        """Flag rows with at least one value above threshold in a single
+            pass, stopping at the first qualifying column.
+
+        :param snaps: 2D array of snap counts (players x years)
+        :param threshold: minimum value to exceed
+        :return: boolean array with one entry per row
+        """
+        n_rows, n_cols = snaps.shape
+        out = np.zeros(n_rows, dtype=np.bool_)
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                if snaps[i, j] > threshold:
+                    out[i] = True
+                    break
+        return out
+
+except ImportError:
+    _any_above_numba = None
+
+
+def _any_above(
+        snaps: np.ndarray,
+        threshold: float
+) -> np.ndarray:
+    """Flag rows with at least one value above threshold, using the
+        numba kernel only for large inputs when numba is installed.
+
+    :param snaps: 2D array of snap counts (players x years)
+    :param threshold: minimum value to exceed
+    :return: boolean array with one entry per row
     """
-    return any(row[col] > percentile_threshold for col in snap_cols)
+    if _any_above_numba is not None and snaps.shape[0] >= _NUMBA_MIN_ROWS:
+        return _any_above_numba(snaps, threshold)
+
+    return _any_above_numpy(snaps, threshold)
+
 
 def create_snap_counts_by_year_df(
         df: pd.DataFrame,
 ) -> pd.DataFrame:
     """Create dataframe where years are columns and values are snap counts.
         The returned dataframe only includes current players (players who
-        started last season). We'll also use a helper function to remove
-        any players whose number of snap count have not been above the top
-        66th percentile in any of the last 5 years.
+        started last season). We'll also remove any players whose number
+        of snap count have not been above the top 66th percentile in any
+        of the last 5 years.
 
     :param df: Dataframe containing name, season, and snap_count
     :return: Dataframe with snap counts by year for current players
     """
-    # sum offensive snaps by season and reset index
-    df = df.groupby(
-        [
-            'name',
-            'season',
-        ]
-    )[
-        'offense_snaps'
-    ].sum().reset_index()
-
-    # Pivot so that snap counts by year are columns
-    df = df.pivot(
+    # Narrow snaps to int32; rows with missing snaps have no season and drop out of the pivot
+    df = df.assign(
+        offense_snaps=df['offense_snaps'].fillna(0).astype('int32')
+    )
+
+    # Sum offensive snaps by season with snap counts by year as columns
+    df = df.pivot_table(
         index='name',
         columns='season',
         values='offense_snaps',
-    ).reset_index()
-
-    # Rename columns to include _snaps
-    df.columns = ['name'] + [f"{int(year)}_snaps" for year in df.columns[1:]]
-
-    # Remove QB's with no snaps in 2024
-    df = df.dropna(subset=['2024_snaps'])
+        aggfunc='sum',
+        fill_value=0,
+        observed=True,
+        sort=False,
+    )
 
-    # Fill the rest of the NaN values with 0
-    df = df.fillna(0)
+    # In one step: remove QB's with no snaps in 2024, put seasons back in order
+    # (sort=False keeps first-seen order) and rename columns to include _snaps
+    df = df.loc[
+        df[2024] > 0,
+        sorted(df.columns)
+    ].rename(
+        columns=lambda season: f"{int(season)}_snaps"
+    ).reset_index()
 
     # Identify snap count columns (YYYY_snaps)
     snap_cols: List[str] = [col for col in df.columns if col.endswith('_snaps')]
@@ -81,15 +127,8 @@ def create_snap_counts_by_year_df(
     ].quantile(0.66)
 
     # Filter players with at least 1 qualifying year
-    qualifying_players: pd.DataFrame
-    qualifying_players = df[
-        df.apply(
-            _has_qualifying_year,
-            axis=1,
-            percentile_threshold=percentile_66,
-            snap_cols=snap_cols,
-        )
-    ]
+    mask = _any_above(df[snap_cols].to_numpy(), percentile_66)
+    qualifying_players: pd.DataFrame = df[mask]
 
     return qualifying_players
 
@@ -104,37 +143,28 @@ def plot_snap_counts(
     """
     # Dynamically identify snap count column
     snap_cols: List[str] = [col for col in df.columns if col.endswith('_snaps')]
-    years: List[int] = [int(col.split('_')[0]) for col in snap_cols]
-
-    # Melt the dataframe to long format for plotting
-    melted_df: pd.DataFrame = pd.melt(
-        df,
-        id_vars=['name'],
-        value_vars=snap_cols,
-        var_name='year',
-        value_name='snaps'
-    )
+    years: pd.Index = pd.Index(snap_cols).str.slice(0, 4).astype('int16')
 
-    melted_df['year'] = melted_df['year'].apply(lambda x: int(x.split('_')[0]))
+    # Pull names and snap counts out as plain arrays
+    names = df['name'].to_numpy()
+    snaps = df[snap_cols].to_numpy()
 
     # Create the plot
     plt.figure(figsize=[12, 6])
     texts: List[plt.Text] = []
-    for name in melted_df['name'].unique():
-        player_data = melted_df[melted_df['name'] == name]
+    for i, name in enumerate(names):
         line, = plt.plot(
-            player_data['year'],
-            player_data['snaps'],
+            years,
+            snaps[i],
             marker='o'
         )
 
         # Label last point with player name
-        last_point = player_data.iloc[-1]
         text = plt.annotate(
             name,
             (
-                last_point['year'],
-                last_point['snaps']
+                years[-1],
+                snaps[i, -1]
             ),
             xytext=(5, 5),
             textcoords='offset points',
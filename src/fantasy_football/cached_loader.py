@@ -0,0 +1,123 @@
+"""On-disk parquet cache for nflverse data.
+
+Functions:
+    load: Return an nfl_data_py import_* data frame, reading it from the local parquet cache when possible
+"""
+from datetime import timedelta
+import hashlib
+from pathlib import Path
+import time
+from typing import (
+    List,
+    Optional,
+    Tuple
+)
+
+import nfl_data_py as nfl
+import pandas as pd
+
+# Local cache for downloaded nflverse data
+CACHE_DIR: Path = Path.home() / '.cache' / 'fantasy_football'
+
+
+def _cache_path(
+    source: str,
+    seasons: Optional[Tuple[int, ...]],
+    kwargs: dict
+) -> Path:
+    """This function returns the parquet path for
+       one import. The file name is the source plus
+       a hash of the seasons and the other arguments
+       of the import, so each distinct call gets its
+       own file. The order of the arguments and of
+       the requested columns doesn't change the key.
+    :param source: Name of the import (e.g. 'weekly_data')
+    :param seasons: Seasons to import, or None
+    :param kwargs: Other arguments of the import
+    :return: Path of the parquet file
+    """
+    # Reordering the columns imports the same data, so it shares one file
+    if 'columns' in kwargs:
+        kwargs = {**kwargs, 'columns': sorted(kwargs['columns'])}
+
+    key = repr((seasons, sorted(kwargs.items())))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+
+    return CACHE_DIR / 'raw' / f'{source}_{digest}.parquet'
+
+
+def _download(
+    source: str,
+    seasons: Optional[Tuple[int, ...]],
+    kwargs: dict,
+    path: Path
+) -> None:
+    """This function downloads one import from
+       nflverse and saves it as parquet at path.
+    :param source: Name of the import without the import_ prefix
+    :param seasons: Seasons to import, or None
+    :param kwargs: Other arguments of the import
+    :param path: Path of the parquet file to write
+    """
+    if seasons is not None:
+        kwargs['years'] = list(seasons)
+    df = getattr(nfl, f'import_{source}')(**kwargs)
+
+    # Write to a temporary file first so an interrupted write never leaves a partial cache file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    df.to_parquet(
+        tmp_path,
+        engine='pyarrow',
+        compression='zstd'
+    )
+    tmp_path.replace(path)
+
+
+def load(
+    source: str,
+    seasons: Optional[Tuple[int, ...]] = None,
+    filters: Optional[List[Tuple[str, str, object]]] = None,
+    read_columns: Optional[List[str]] = None,
+    max_age: Optional[timedelta] = None,
+    **kwargs
+) -> pd.DataFrame:
+    """This function returns the data frame from
+       nfl.import_<source>, reading it from the
+       parquet cache under CACHE_DIR if an earlier
+       run already downloaded it.
+
+       Note: The cache holds the whole import; filters
+             and read_columns are pushed down to the
+             parquet reader, so rows that don't match
+             and columns that aren't listed are never
+             converted to pandas.
+
+             A cached import is kept forever unless
+             max_age is given; use it for data that
+             still changes (e.g. the current season's
+             depth charts).
+    :param source: Name of the import without the import_ prefix (e.g. 'weekly_data')
+    :param seasons: Seasons to import (passed as years), or None for imports without years
+    :param filters: Row filters in pyarrow's format (e.g. [('position', 'in', ['QB'])]), or None
+    :param read_columns: Columns to read from the cache, or None for the columns argument
+                         of the import (or all, for imports without one, e.g. snap_counts)
+    :param max_age: Download again if the cached file is older than this, or None to never expire
+    :param kwargs: Other arguments of the import (e.g. columns, stat_type)
+    :return: DataFrame
+    """
+    path = _cache_path(source, seasons, kwargs)
+
+    # Download from nflverse unless this import was cached before (within max_age, if given)
+    if not path.exists() or (
+        max_age is not None
+        and time.time() - path.stat().st_mtime > max_age.total_seconds()
+    ):
+        _download(source, seasons, kwargs, path)
+
+    return pd.read_parquet(
+        path,
+        engine='pyarrow',
+        columns=read_columns if read_columns is not None else kwargs.get('columns'),
+        filters=filters
+    )
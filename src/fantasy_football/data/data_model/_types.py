@@ -0,0 +1,55 @@
+"""Shared field types and lookups for the data models.
+
+Types:
+    GsisId: A gsis_id string (##-#######) validated by one shared, precompiled pattern
+    Position: A position string validated against VALID_POSITIONS
+"""
+import re
+
+from typing import Annotated
+
+from pydantic import (
+    AfterValidator,
+    Field
+)
+
+# gsis_id pattern (##-#######), compiled once for every model; always used with fullmatch
+GSIS_ID_RE = re.compile(r'\d{2}-\d{7}')
+
+# Valid player positions
+VALID_POSITIONS = frozenset({'QB', 'RB', 'WR', 'TE'})
+
+# Valid NFL team abbreviations
+VALID_TEAMS = frozenset({
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
+    'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA',
+    'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB',
+    'TEN', 'WAS'
+})
+
+# Valid season types
+VALID_SEASON_TYPES = frozenset({'REG', 'POST'})
+
+
+def check_gsis_id(v: str) -> str:
+    """Validate that gsis_id matches the format ##-####### (e.g., '00-0034407')."""
+    # Cheap length and digit checks accept well-formed ids without the regex
+    # (isdecimal accepts exactly the characters \d does)
+    if len(v) == 10 and v[2] == '-' and v[:2].isdecimal() and v[3:].isdecimal():
+        return v
+
+    if not GSIS_ID_RE.fullmatch(v):
+        raise ValueError(f"GSIS ID {v} does not match format ##-#######.")
+    return v
+
+
+def check_position(v: str) -> str:
+    """Validate that position is one of ['QB', 'RB', 'WR', 'TE']."""
+    if v not in VALID_POSITIONS:
+        raise ValueError(f"Position {v} is not in {sorted(VALID_POSITIONS)}.")
+    return v
+
+
+GsisId = Annotated[str, Field(min_length=10, max_length=10, frozen=True), AfterValidator(check_gsis_id)]
+
+Position = Annotated[str, AfterValidator(check_position)]
@@ -3,14 +3,21 @@
 Classes:
     PassingMetrics: A Pydantic data model representing weekly passing metrics
 """
-import re
+from typing import List
 
+from pandas import DataFrame
 from pydantic import (
     BaseModel,
     Field,
+    TypeAdapter,
     field_validator
 )
 
+from fantasy_football.data.data_model._types import (
+    VALID_SEASON_TYPES,
+    GsisId
+)
+
 class PassingMetrics(BaseModel):
     """A Pydantic model representing NFL quarterback passing metrics at the week and player level.
 
@@ -46,7 +53,7 @@ class PassingMetrics(BaseModel):
         sack_fumbles (int): Total number of sack fumbles. (weekly)
         sack_fumbles_lost (int): Total number of sack fumbles lost. (weekly)
     """
-    gsis_id: str = Field(min_length=10, max_length=10, frozen=True)
+    gsis_id: GsisId
     season: int = Field(ge=1999, le=2025, frozen=False)
     season_type: str = Field(min_length=3, max_length=4, frozen=False)
     week: int = Field(ge=0, frozen=False)
@@ -73,85 +80,31 @@ class PassingMetrics(BaseModel):
     sack_fumbles: int = Field(ge=0, frozen=False)
     sack_fumbles_lost: int = Field(ge=0, frozen=False)
 
-# validator for player id format ##_#######
-@field_validator('gsis_id')
-def validate_player_id(
-        cls,
-        v: str
-) -> str:
-    """Validate that player_id matches the format ##_####### (two digits, underscore, seven digits)."""
-    pattern = r'^\d{2}-\d{7}$'
-
-    if not re.match(pattern, v):
-        raise ValueError(f"GSIS ID {v} does not match format ##_#######.")
-
-    return v
-
-# validate season type in ['REG', 'POST']
-@field_validator('season_type')
-def validate_season_type(
-         cls,
-         v: str
- ) -> str:
-    """Validate that season_type is one of ['REG', 'POST']."""
-    valid_types = ['REG', 'POST']
-    if v not in valid_types:
-        raise ValueError(f"Season type {v} is not in {valid_types}.")
-    return v
-
- # Validate team abbreviation
-@field_validator('team_abbr')
-def validate_team_abbr(
+    @classmethod
+    def create_from_df(
         cls,
-        v: str
-) -> str:
-    """Validate that team_abbr is a valid NFL team abbreviation."""
-    valid_teams = [
-        'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-        'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA',
-        'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB',
-        'TEN', 'WAS'
-    ]
-    if v not in valid_teams:
-        raise ValueError(f"Team abbreviation {v} is not a valid NFL team.")
-    return v
+        df: DataFrame
+    ) -> List["PassingMetrics"]:
+        """This function creates PassingMetrics instances
+           from a merged dataframe in one batched validation
+           pass.
+        :param df: DataFrame with a column for each PassingMetrics field
+        :return: List of PassingMetrics instances.
+        """
+        return _PASSING_METRICS_ADAPTER.validate_python(
+            df.to_dict(orient='records')
+        )
 
-# position in ['QB', 'RB', 'WR', 'TE']
-@field_validator('position')
-def validate_position(
-        cls,
-        v: str
-) -> str:
-    """Validate that position is one of ['QB', 'RB', 'WR', 'TE']."""
-    valid_positions = ['QB', 'RB', 'WR', 'TE']
-
-    if v not in valid_positions:
-        raise ValueError(f"Your position {v} is not in ['QB', 'RB', 'WR', 'TE'].")
-
-    return v
-
-# Convert int fields to int
-@field_validator(
-    'attempts',
-    'pass_touchdowns',
-    'interceptions',
-    'completions',
-    'sacks',
-    'sack_fumbles',
-    'sack_fumbles_lost',
-    mode='before'
-)
-def to_int(
-        cls,
-        v: any,
-        field: str
-) -> int:
-    """Convert numeric fields to integers, handling float or string inputs."""
-    if isinstance(v, int):
+    # validate season type in ['REG', 'POST']
+    @field_validator('season_type')
+    def validate_season_type(
+            cls,
+            v: str
+    ) -> str:
+        """Validate that season_type is one of ['REG', 'POST']."""
+        if v not in VALID_SEASON_TYPES:
+            raise ValueError(f"Season type {v} is not in {sorted(VALID_SEASON_TYPES)}.")
         return v
-    try:
-        return int(float(v))
-    except (ValueError, TypeError):
-        raise ValueError(
-            f"{field} must be convertible to an integer, got {v}")
 
+# List validator reused by create_from_df
+_PASSING_METRICS_ADAPTER = TypeAdapter(List[PassingMetrics])
@@ -4,17 +4,134 @@ Classes:
     Player: A Pydantic model representing an nfl player with field constraints for age, weight, height,
             a validator to calculate age, and properties to track if the player is currently active
             and first string.
+    PlayerRec: A slotted, frozen, read-only copy of a validated Player for holding large collections.
+    Status: An IntEnum of nflverse roster status codes.
 """
 from __future__ import annotations
 
-from pandas import Series
+from dataclasses import (
+    dataclass,
+    fields
+)
+from datetime import timedelta
+from enum import IntEnum
+from functools import lru_cache
+import logging
+from typing import (
+    Annotated,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple
+)
+
+from pandas import (
+    DataFrame,
+    Series
+)
 from pydantic import (
     BaseModel,
+    BeforeValidator,
     Field,
-    field_validator
+    PrivateAttr,
+    TypeAdapter
 )
-import re
-import nfl_data_py as nfl
+
+from fantasy_football import cached_loader
+from fantasy_football.data.data_model._types import (
+    GsisId,
+    Position
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Status(IntEnum):
+    """nflverse roster status codes."""
+    ACT = 1
+    INA = 2
+    RES = 3
+    DEV = 4
+    CUT = 5
+    RET = 6
+    EXE = 7
+    UFA = 8
+    TRC = 9
+    TRD = 10
+    SUS = 11
+
+
+# Status lookup by roster code, built once
+_STATUS_MAP: Dict[str, Status] = {status.name: status for status in Status}
+
+
+def _to_status(v: object) -> object:
+    """Map a roster status code (e.g. 'ACT') to its Status member."""
+    if isinstance(v, Status):
+        return v
+
+    status = _STATUS_MAP.get(v)
+    if status is None:
+        raise ValueError(f"Status {v} is not in {list(_STATUS_MAP)}.")
+    return status
+
+
+# Depth charts change during the season, so the on-disk copy is refreshed after this long
+_DEPTH_CHARTS_MAX_AGE: timedelta = timedelta(days=1)
+
+# Depth chart columns the first-string lookups read, with the dtypes of the empty fallback
+# (numeric espn_id so it still merges with the ids table's float espn_id)
+_DEPTH_CHARTS_COLUMNS: Dict[str, str] = {
+    'espn_id': 'float64',
+    'team': 'object',
+    'position': 'object',
+    'depth_pos': 'float64'
+}
+
+
+@lru_cache(maxsize=4)
+def _depth_charts(season: int) -> DataFrame:
+    """Import the depth charts for a season once per process.
+
+    The on-disk copy is downloaded again once it is older than
+    _DEPTH_CHARTS_MAX_AGE. A failed import, or one missing any of
+    _DEPTH_CHARTS_COLUMNS, is logged once and cached as an empty frame, so
+    later lookups for the season find no players instead of retrying the
+    fetch or raising. The empty frame keeps the column dtypes, so
+    annotate_first_string can still merge on it.
+    """
+    try:
+        depth_charts = cached_loader.load(
+            'depth_charts',
+            seasons=(season,),
+            max_age=_DEPTH_CHARTS_MAX_AGE
+        )
+
+        # Check the schema here so the lookups can index the columns freely
+        missing = [col for col in _DEPTH_CHARTS_COLUMNS if col not in depth_charts.columns]
+        if missing:
+            raise KeyError(f"Depth charts are missing columns {missing}")
+
+        return depth_charts
+
+    except Exception:
+        logger.warning(f"Error fetching depth charts for season {season}", exc_info=True)
+        return DataFrame(columns=list(_DEPTH_CHARTS_COLUMNS)).astype(_DEPTH_CHARTS_COLUMNS)
+
+
+@lru_cache(maxsize=4)
+def _first_string_set(season: int) -> FrozenSet[Tuple[int, str, str]]:
+    """The (espn_id, team, position) of every first-string (depth_pos 1) player for a season."""
+    depth_charts = _depth_charts(season)
+    depth_charts = depth_charts[depth_charts['depth_pos'] == 1]
+
+    # Zip the key columns directly rather than building a MultiIndex
+    return frozenset(zip(
+        depth_charts['espn_id'],
+        depth_charts['team'],
+        depth_charts['position']
+    ))
 
 
 class Player(BaseModel):
@@ -25,7 +142,7 @@ class Player(BaseModel):
         espn_id (int): espn identifier
         pfr_id (str): pfr id
         name (str): player name
-        status (str): whether or not the player is active
+        status (Status): the player's roster status (e.g. Status.ACT)
         team (str): the team the player currently plays for
         position (str): one of ('QB', 'RB', 'WR', 'TE', 'DEF') (ngs)
         height (float): player's height (inches)
@@ -39,13 +156,13 @@ class Player(BaseModel):
         fantasy_points_ppr (float): number of fantasy_points per week (weekly)
 
     """
-    gsis_id: str = Field(min_length=10, max_length=10, frozen=True)
+    gsis_id: GsisId
     espn_id: int = Field(frozen=True)
     pfr_id: str = Field(min_length=1, frozen=True)
     name: str = Field(min_length=1, frozen=True)
-    status: str = Field(min_length=2, max_length=3, frozen=False)
+    status: Annotated[Status, BeforeValidator(_to_status)] = Field(frozen=False)
     team: str = Field(min_length=2, max_length=3, frozen=False)
-    position: str = Field(min_length=1, max_length=3, frozen=False)
+    position: Position = Field(min_length=1, max_length=3, frozen=False)
     height: float = Field(gt=60, lt=90, frozen=False)
     weight: float = Field(gt=150, lt=450, frozen=False)
     college: str = Field(min_length=1, frozen=True)
@@ -56,45 +173,102 @@ class Player(BaseModel):
     fantasy_points: float = Field(frozen=False)
     fantasy_points_ppr: float = Field(frozen=False)
 
+    # Set from an is_first_string column (see annotate_first_string) or on first property access
+    _first_string: Optional[bool] = PrivateAttr(default=None)
+
     @classmethod
-    def create_from_qb_df(
+    def create_from_df(
         cls,
-        player_id_df: Series,
-        weekly_roster_df: Series,
-        weekly_stats_df: Series,
-        snap_count_df: Series,
-        sacks_df: Series,
-        ngs_passing_df: Series
+        df: DataFrame
+    ) -> List["Player"]:
+        """This function creates Player instances from
+           a merged dataframe in one batched validation
+           pass instead of one model call per row.
+        :param df: DataFrame with a column for each Player field
+        :return: List of Player instances.
+        """
+        # gsis_id and position are checked per row by the GsisId and Position types
+        records = df.to_dict(orient='records')
+
+        players: List[Player] = _PLAYER_ADAPTER.validate_python(records)
+
+        # Carry over first-string flags computed by annotate_first_string
+        if 'is_first_string' in df.columns:
+            for player, is_first_string in zip(players, df['is_first_string'].tolist()):
+                player._first_string = is_first_string
+
+        return players
+
+    @classmethod
+    def create_from_trusted_row(
+        cls,
+        row: Dict[str, object]
     ) -> "Player":
-        """This function creates an instance of the
-           Player class from QB series.
-        :param player_id_df: Series containing player identifiers
-        :param weekly_roster_df: Series with data from weekly roster
-        :param weekly_stats_df: Series with fantasy points.
-        :param snap_count_df: Series with snap counts and snap count pct
-        :param sacks_df: Series with sack counts
+        """This function creates a Player without running
+           validation, for rows that were already validated
+           (e.g. read back from the parquet cache). Use
+           create_from_df for data straight from nflverse.
+        :param row: Dict of Player field names to values
         :return: The Player instance.
         """
+        # Stored rows hold the status code, so map it to Status here
+        if 'status' in row:
+            row = {**row, 'status': _to_status(row['status'])}
 
-        # Todo: Add code here to use the series that
-        #       represent rows in the dataframes for
-        #       a specific QB. Get everything you need
-        #       or need to calculate.
+        return cls.model_construct(**row)
 
-        # Create an instance of the class.
-        return cls(
-            # Fill this in, which the parameters from this class.
+    @classmethod
+    def annotate_first_string(
+        cls,
+        players_df: DataFrame,
+        season: int = 2025
+    ) -> DataFrame:
+        """This function adds an is_first_string column
+           to a players dataframe with one join against
+           the season's depth charts.
+        :param players_df: DataFrame with espn_id, team and position columns
+        :param season: The season of the depth charts to join
+        :return: players_df with a boolean is_first_string column.
+        """
+        keys: List[str] = [
+            'espn_id',
+            'team',
+            'position'
+        ]
+
+        # One depth_pos per player, team and position
+        depth_charts = _depth_charts(season)[keys + ['depth_pos']].drop_duplicates(
+            subset=keys,
+            keep='last'
+        )
+
+        players_df = players_df.merge(
+            depth_charts,
+            on=keys,
+            how='left'
         )
+        players_df['is_first_string'] = players_df['depth_pos'].eq(1)
 
+        return players_df.drop(columns='depth_pos')
+
+    @classmethod
+    def active_mask(
+        cls,
+        df: DataFrame
+    ) -> Series:
+        """This function returns whether each row of
+           a players dataframe is active, for use in
+           place of is_active over many players.
+        :param df: DataFrame with a status column
+        :return: Boolean Series, True where status is 'ACT'.
+        """
+        return df['status'].eq('ACT')
 
     # Property for is active
     @property
     def is_active(self) -> bool:
         """Whether or not the player is currently active."""
-        if self.status == 'ACT':
-            return True
-        else:
-            return False
+        return self.status is Status.ACT
 
     # Property for 1st string
     @property
@@ -104,70 +278,69 @@ class Player(BaseModel):
         Returns:
             bool: True if the player's depth_team rank is 1, False otherwise or if data is unavailable.
         """
-        try:
-            # Import depth charts for the current season (2025)
-            depth_charts = nfl.import_depth_charts([2025])
-
-            # Filter for the player's team, position, and player_id
-            player_depth = depth_charts[
-                (depth_charts['espn_id'] == self.espn_id) &
-                (depth_charts['team'] == self.team) &
-                (depth_charts['position'] == self.position)
-            ]
-
-            # Check if depth_pos == 1 (first-string)
-            if not player_depth.empty and player_depth['depth_pos'].iloc[0] == 1:
-                return True
-
-            return False
-
-        except Exception as e:
-            print(f"Error fetching depth chart for player {self.gsis_id}: {e}")
-            return False
-
-    # validator for player id format ##_#######
-    @field_validator('player_id')
-    def validate_player_id(
-            cls,
-            v: str
-    ) -> str:
-        """Validate that player_id matches the format ##_####### (two digits, underscore, seven digits)."""
-        pattern = r'^\d{2}-\d{7}$'
-
-        if not re.match(pattern, v):
-            raise ValueError(f"Player ID {v} does not match format ##_#######.")
+        # Already set by create_from_df or an earlier access
+        if self._first_string is not None:
+            return self._first_string
 
-        return v
+        # Check the player against the cached first-string set for the current season (2025)
+        self._first_string = (self.espn_id, self.team, self.position) in _first_string_set(2025)
 
-    # position in ['QB', 'RB', 'WR', 'TE']
-    @field_validator('position')
-    def validate_position(
-            cls,
-            v: str
-    ) -> str:
-        """Validate that position is one of ['QB', 'RB', 'WR', 'TE']."""
-        valid_positions = ['QB', 'RB', 'WR', 'TE']
+        return self._first_string
 
-        if v not in valid_positions:
-            raise ValueError(f"Your position {v} is not in ['QB', 'RB', 'WR', 'TE'].")
 
-        return v
+@dataclass(slots=True, frozen=True)
+class PlayerRec:
+    """A read-only record of an already validated Player.
+
+    Slots instead of a per-instance __dict__ roughly halve the memory of
+    each record, so long-lived player collections should hold these rather
+    than the Pydantic models. Fields mirror Player (see Player for details).
+    """
+    gsis_id: str
+    espn_id: int
+    pfr_id: str
+    name: str
+    status: Status
+    team: str
+    position: str
+    height: float
+    weight: float
+    college: str
+    years_exp: int
+    age: float
+    offense_snaps: int
+    offense_pct: float
+    fantasy_points: float
+    fantasy_points_ppr: float
+
+    @classmethod
+    def from_pydantic(
+        cls,
+        player: Player
+    ) -> "PlayerRec":
+        """This function copies a validated Player
+           into a PlayerRec.
+        :param player: The validated Player instance
+        :return: The PlayerRec instance.
+        """
+        return cls(*[getattr(player, name) for name in _PLAYER_REC_FIELDS])
+
+    @classmethod
+    def from_players(
+        cls,
+        players: List[Player]
+    ) -> List["PlayerRec"]:
+        """This function copies a list of validated
+           Players into PlayerRecs, so the Pydantic
+           objects can be dropped after validation.
+        :param players: List of validated Player instances
+        :return: List of PlayerRec instances.
+        """
+        return [cls.from_pydantic(player) for player in players]
+
+
+# Field names in PlayerRec's positional order
+_PLAYER_REC_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(PlayerRec))
 
-    # Convert int fields to int
-    @field_validator(
-        'offense_snaps',
-        mode='before'
-    )
-    def to_int(
-            cls,
-            v: any,
-            field: str
-    ) -> int:
-        """Convert numeric fields to integers, handling float or string inputs."""
-        if isinstance(v, int):
-            return v
-        try:
-            return int(float(v))
-        except (ValueError, TypeError):
-            raise ValueError(
-                f"{field} must be convertible to an integer, got {v}")
+# List validator reused by create_from_df
+_PLAYER_ADAPTER = TypeAdapter(List[Player])
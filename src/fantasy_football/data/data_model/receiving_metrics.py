@@ -3,9 +3,11 @@
 Classes:
     ReceivingMetrics: A Pydantic data model representing weekly receiving metrics
 """
-import re
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pandas import DataFrame
+from fantasy_football.data.data_model._types import VALID_SEASON_TYPES, VALID_TEAMS, GsisId, Position
+from fantasy_football.data.data_model.validate_metrics import check_bounds
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+from typing import List
 
 class ReceivingMetrics(BaseModel):
     """A Pydantic model representing NFL receiving metrics at the week and player level.
@@ -34,11 +36,11 @@ class ReceivingMetrics(BaseModel):
         avg_expected_yac (float): Average expected yards after catch per reception.
         avg_yac_above_expectation (float): Average yards after catch above expected per reception.
     """
-    gsis_id: str = Field(min_length=10, max_length=10, frozen=True)
+    gsis_id: GsisId
     season: int = Field(ge=1999, le=2025, frozen=False)
     season_type: str = Field(min_length=3, max_length=4, frozen=False)
     week: int = Field(ge=0, le=18, frozen=False)
-    position: str = Field(min_length=1, max_length=3, frozen=False)
+    position: Position = Field(min_length=1, max_length=3, frozen=False)
     team_abbr: str = Field(min_length=2, max_length=3, frozen=False)
     avg_cushion: float = Field(ge=0, frozen=False)
     avg_separation: float = Field(ge=0, frozen=False)
@@ -53,16 +55,23 @@ class ReceivingMetrics(BaseModel):
     avg_expected_yac: float = Field(frozen=False)
     avg_yac_above_expectation: float = Field(frozen=False)
 
-    @field_validator('gsis_id')
-    def validate_gsis_id(
+    @classmethod
+    def create_from_df(
         cls,
-        v: str
-    ) -> str:
-        """Validate that gsis_id matches the format ##-####### (e.g., '00-0034407')."""
-        pattern = r'^\d{2}-\d{7}$'
-        if not re.match(pattern, v):
-            raise ValueError(f"GSIS ID {v} does not match format ##-#######.")
-        return v
+        df: DataFrame
+    ) -> List["ReceivingMetrics"]:
+        """This function creates ReceivingMetrics instances
+           from a dataframe in one batched validation
+           pass, checking numeric bounds for whole
+           columns first.
+        :param df: DataFrame with a column for each ReceivingMetrics field
+        :return: List of ReceivingMetrics instances.
+        """
+        check_bounds(df, cls)
+
+        return _RECEIVING_METRICS_ADAPTER.validate_python(
+            df.to_dict(orient='records')
+        )
 
     @field_validator('season_type')
     def validate_season_type(
@@ -70,9 +79,8 @@ class ReceivingMetrics(BaseModel):
         v: str
     ) -> str:
         """Validate that season_type is one of ['REG', 'POST']."""
-        valid_types = ['REG', 'POST']
-        if v not in valid_types:
-            raise ValueError(f"Season type {v} is not in {valid_types}.")
+        if v not in VALID_SEASON_TYPES:
+            raise ValueError(f"Season type {v} is not in {sorted(VALID_SEASON_TYPES)}.")
         return v
 
     @field_validator('team_abbr')
@@ -81,64 +89,22 @@ class ReceivingMetrics(BaseModel):
         v: str
     ) -> str:
         """Validate that team_abbr is a valid NFL team abbreviation."""
-        valid_teams = [
-            'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-            'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA',
-            'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB',
-            'TEN', 'WAS'
-        ]
-        if v not in valid_teams:
+        if v not in VALID_TEAMS:
             raise ValueError(f"Team abbreviation {v} is not a valid NFL team.")
         return v
 
-    @field_validator('position')
-    def validate_position(
-        cls,
-        v: str
-    ) -> str:
-        """Validate that position is one of ['QB', 'RB', 'WR', 'TE']."""
-        valid_positions = ['QB', 'RB', 'WR', 'TE']
-        if v not in valid_positions:
-            raise ValueError(f"Position {v} is not in {valid_positions}.")
-        return v
-
-    @field_validator(
-        'receptions',
-        'targets',
-        'rec_touchdowns',
-        mode='before'
-    )
-    def to_int(
-        cls,
-        v: any,
-        field: any
-    ) -> int:
-        """Convert numeric fields to integers, handling float or string inputs."""
-        if isinstance(v, int):
-            return v
-        try:
-            return int(float(v))
-        except (ValueError, TypeError):
-            raise ValueError(f"{field.name} must be convertible to an integer, got {v}")
-
-    @field_validator(
-        'catch_percentage',
-        mode='before'
-    )
-    def validate_catch_percentage(
-        cls,
-        v: float,
-        values: dict
-    ) -> float:
+    @model_validator(mode='after')
+    def validate_catch_percentage(self) -> "ReceivingMetrics":
         """Validate that catch_percentage matches receptions/targets * 100 within a small margin."""
-        if 'receptions' in values and 'targets' in values:
-            receptions = values['receptions']
-            targets = values['targets']
-            if targets > 0:
-                expected_catch_pct = (receptions / targets) * 100
-                if abs(v - expected_catch_pct) > 0.01:  # Allow small floating-point errors
-                    raise ValueError(
-                        f"catch_percentage {v} does not match receptions {receptions} / targets {targets} * 100"
-                    )
-        return v
+        if self.targets > 0:
+            expected_catch_pct = (self.receptions / self.targets) * 100
+            if abs(self.catch_percentage - expected_catch_pct) > 0.01:  # Allow small floating-point errors
+                raise ValueError(
+                    f"catch_percentage {self.catch_percentage} does not match "
+                    f"receptions {self.receptions} / targets {self.targets} * 100"
+                )
+        return self
+
 
+# List validator reused by create_from_df
+_RECEIVING_METRICS_ADAPTER = TypeAdapter(List[ReceivingMetrics])
@@ -3,8 +3,11 @@
 Classes:
     RushingMetrics: A Pydantic data model representing weekly rushing metrics
 """
-import re
-from pydantic import BaseModel, Field, field_validator
+from pandas import DataFrame
+from fantasy_football.data.data_model._types import VALID_SEASON_TYPES, VALID_TEAMS, GsisId, Position
+from fantasy_football.data.data_model.validate_metrics import check_bounds
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+from typing import List
 
 class RushingMetrics(BaseModel):
     """A Pydantic model representing NFL rushing metrics at the week and player level.
@@ -32,11 +35,11 @@ class RushingMetrics(BaseModel):
         rush_yards_over_expected_per_att (float): Rushing yards over expected per attempt.
         rush_pct_over_expected (float): Percentage of rushes exceeding expected yards.
     """
-    gsis_id: str = Field(min_length=10, max_length=10, frozen=True)
+    gsis_id: GsisId
     season: int = Field(ge=1999, le=2025, frozen=False)
     season_type: str = Field(min_length=3, max_length=4, frozen=False)
     week: int = Field(ge=0, le=18, frozen=False)
-    position: str = Field(min_length=1, max_length=3, frozen=False)
+    position: Position = Field(min_length=1, max_length=3, frozen=False)
     team_abbr: str = Field(min_length=2, max_length=3, frozen=False)
     efficiency: float = Field(frozen=False)
     percent_attempts_gte_eight_defenders: float = Field(ge=0, le=100, frozen=False)
@@ -50,16 +53,23 @@ class RushingMetrics(BaseModel):
     rush_yards_over_expected_per_att: float = Field(frozen=False)
     rush_pct_over_expected: float = Field(ge=0, le=1, frozen=False)
 
-    @field_validator('gsis_id')
-    def validate_gsis_id(
+    @classmethod
+    def create_from_df(
         cls,
-        v: str
-    ) -> str:
-        """Validate that gsis_id matches the format ##-####### (e.g., '00-0037263')."""
-        pattern = r'^\d{2}-\d{7}$'
-        if not re.match(pattern, v):
-            raise ValueError(f"GSIS ID {v} does not match format ##-#######.")
-        return v
+        df: DataFrame
+    ) -> List["RushingMetrics"]:
+        """This function creates RushingMetrics instances
+           from a dataframe in one batched validation
+           pass, checking numeric bounds for whole
+           columns first.
+        :param df: DataFrame with a column for each RushingMetrics field
+        :return: List of RushingMetrics instances.
+        """
+        check_bounds(df, cls)
+
+        return _RUSHING_METRICS_ADAPTER.validate_python(
+            df.to_dict(orient='records')
+        )
 
     @field_validator('season_type')
     def validate_season_type(
@@ -67,9 +77,8 @@ class RushingMetrics(BaseModel):
         v: str
     ) -> str:
         """Validate that season_type is one of ['REG', 'POST']."""
-        valid_types = ['REG', 'POST']
-        if v not in valid_types:
-            raise ValueError(f"Season type {v} is not in {valid_types}.")
+        if v not in VALID_SEASON_TYPES:
+            raise ValueError(f"Season type {v} is not in {sorted(VALID_SEASON_TYPES)}.")
         return v
 
     @field_validator('team_abbr')
@@ -78,60 +87,22 @@ class RushingMetrics(BaseModel):
         v: str
     ) -> str:
         """Validate that team_abbr is a valid NFL team abbreviation."""
-        valid_teams = [
-            'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN',
-            'DET', 'GB', 'HOU', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA',
-            'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB',
-            'TEN', 'WAS'
-        ]
-        if v not in valid_teams:
+        if v not in VALID_TEAMS:
             raise ValueError(f"Team abbreviation {v} is not a valid NFL team.")
         return v
 
-    @field_validator('position')
-    def validate_position(
-        cls,
-        v: str
-    ) -> str:
-        """Validate that position is one of ['QB', 'RB', 'WR', 'TE']."""
-        valid_positions = ['QB', 'RB', 'WR', 'TE']
-        if v not in valid_positions:
-            raise ValueError(f"Position {v} is not in {valid_positions}.")
-        return v
+    @model_validator(mode='after')
+    def validate_avg_rush_yards(self) -> "RushingMetrics":
+        """Validate that avg_rush_yards matches rush_yards/rush_attempts within a small margin."""
+        if self.rush_attempts > 0:
+            expected_avg = self.rush_yards / self.rush_attempts
+            if abs(self.avg_rush_yards - expected_avg) > 0.01:  # Allow small floating-point errors
+                raise ValueError(
+                    f"avg_rush_yards {self.avg_rush_yards} does not match "
+                    f"rush_yards {self.rush_yards} / rush_attempts {self.rush_attempts}"
+                )
+        return self
 
-    @field_validator(
-        'rush_attempts',
-        'rush_yards',
-        'rush_touchdowns',
-        mode='before'
-    )
-    def to_int(
-        cls,
-        v: any,
-        field: any
-    ) -> int:
-        """Convert numeric fields to integers, handling float or string inputs."""
-        if isinstance(v, int):
-            return v
-        try:
-            return int(float(v))
-        except (ValueError, TypeError):
-            raise ValueError(f"{field.name} must be convertible to an integer, got {v}")
 
-    @field_validator('avg_rush_yards', mode='before')
-    def validate_avg_rush_yards(
-        cls,
-        v: float,
-        values: dict
-    ) -> float:
-        """Validate that avg_rush_yards matches rush_yards/rush_attempts within a small margin."""
-        if 'rush_yards' in values and 'rush_attempts' in values:
-            rush_yards = values['rush_yards']
-            rush_attempts = values['rush_attempts']
-            if rush_attempts > 0:
-                expected_avg = rush_yards / rush_attempts
-                if abs(v - expected_avg) > 0.01:  # Allow small floating-point errors
-                    raise ValueError(
-                        f"avg_rush_yards {v} does not match rush_yards {rush_yards} / rush_attempts {rush_attempts}"
-                    )
-        return v
\ No newline at end of file
+# List validator reused by create_from_df
+_RUSHING_METRICS_ADAPTER = TypeAdapter(List[RushingMetrics])
@@ -0,0 +1,63 @@
+"""Vectorized bounds checks for bulk metrics ingest.
+
+Functions:
+    check_bounds: Check a dataframe's columns against the numeric Field bounds of a Pydantic model
+"""
+import operator
+from typing import (
+    Callable,
+    Dict,
+    Type
+)
+
+import numpy as np
+from pandas import DataFrame
+from pydantic import BaseModel
+
+# Comparison each bound attribute of a Field constraint (e.g. Ge.ge) requires
+_BOUND_OPS: Dict[str, Callable] = {
+    'ge': operator.ge,
+    'gt': operator.gt,
+    'le': operator.le,
+    'lt': operator.lt
+}
+
+
+def check_bounds(
+    df: DataFrame,
+    model: Type[BaseModel]
+) -> None:
+    """This function checks each column of df
+       against the ge/gt/le/lt bounds on the
+       model's Field definitions, one comparison
+       per column, so an out of range row fails
+       before any model is built.
+    :param df: DataFrame with a column for each model field (extra columns are ignored)
+    :param model: The Pydantic model whose bounds to check
+    :return:
+    """
+    for name, field in model.model_fields.items():
+        if name not in df.columns:
+            continue
+
+        # Read the bounds by attribute name, so any constraint object with ge/gt/le/lt counts
+        bounds = [
+            (attr, getattr(constraint, attr))
+            for constraint in field.metadata
+            for attr in _BOUND_OPS
+            if getattr(constraint, attr, None) is not None
+        ]
+        if not bounds:
+            continue
+
+        # Nullable columns become NaN, which fails every bound just like Pydantic would
+        values = df[name].to_numpy(dtype='float64', na_value=np.nan)
+
+        for attr, bound in bounds:
+            ok = _BOUND_OPS[attr](values, bound)
+
+            if not ok.all():
+                row = np.flatnonzero(~ok)[0]
+                raise ValueError(
+                    f"{name} {values[row]} at row {df.index[row]} does not satisfy {attr}={bound}."
+                )
@@ -15,4 +15,7 @@ class AllDataFrames(NamedTuple):
     player_id_df: DataFrame
     snap_count_df: DataFrame
     weekly_roster_df: DataFrame
-    weekly_stats_df: DataFrame
\ No newline at end of file
+    weekly_stats_df: DataFrame
+    ngs_passing_df: DataFrame
+    ngs_rushing_df: DataFrame
+    ngs_receiving_df: DataFrame
\ No newline at end of file
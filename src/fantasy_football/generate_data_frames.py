@@ -1,69 +1,234 @@
-import nfl_data_py as nfl
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Dict,
+    List
+)
+
+import numpy as np
+import pandas as pd
+from fantasy_football import cached_loader
+from fantasy_football.cached_loader import CACHE_DIR
 from fantasy_football.data.named_tuple.all_data_frames import AllDataFrames
 from fantasy_football.data.named_tuple.passing_data_frames import PasserDataFrames
 from fantasy_football.data.named_tuple.rushing_data_frames import RusherDataFrames
 from fantasy_football.data.named_tuple.receiving_data_frames import ReceiverDataFrames
 
+# Positions kept in AllDataFrames, built once for every filter
+SKILL_POSITIONS: np.ndarray = np.array(['QB', 'RB', 'WR', 'TE'], dtype=object)
+
+# Positions kept by create_rusher_dfs and create_receiver_dfs
+RUSHER_RECEIVER_POSITIONS: np.ndarray = np.array(['RB', 'WR', 'TE'], dtype=object)
+
+# Player id columns of each AllDataFrames field, stored as Arrow-backed strings
+_ID_COLUMNS: Dict[str, List[str]] = {
+    'player_id_df': ['gsis_id', 'pfr_id'],
+    'weekly_roster_df': ['player_id'],
+    'snap_count_df': ['gsis_id'],
+    'weekly_stats_df': ['player_id'],
+    'ngs_passing_df': ['player_gsis_id'],
+    'ngs_rushing_df': ['player_gsis_id'],
+    'ngs_receiving_df': ['player_gsis_id']
+}
+
+
+def _all_dfs_cache_paths() -> Dict[str, Path]:
+    """This function returns the parquet path for
+       each AllDataFrames field. The directory name
+       includes a hash of this module and of
+       cached_loader, so changing how the data
+       frames are built or read starts a fresh
+       cache.
+    :return: Dict of field name to parquet path
+    """
+    sha1 = hashlib.sha1(Path(__file__).read_bytes())
+    sha1.update(Path(cached_loader.__file__).read_bytes())
+    digest = sha1.hexdigest()[:12]
+    cache_dir = CACHE_DIR / f'all_dfs_{digest}'
+
+    return {
+        name: cache_dir / f'{name}.parquet'
+        for name in AllDataFrames._fields
+    }
+
+
+def normalize_dtypes(
+    df: pd.DataFrame,
+) -> pd.DataFrame:
+    """This function narrows the dtypes of the columns
+       shared across the data frames: week to int8,
+       season to int16, team/team_abbr/position/status
+       to category and offense_pct to float32. Integer
+       columns with missing values (e.g. players with
+       no snap counts after a left merge) use the
+       nullable Int8/Int16 instead. Columns the data
+       frame doesn't have are skipped.
+    :param df: DataFrame
+    :return: DataFrame with narrowed dtypes
+    """
+    dtypes: Dict[str, str] = {
+        'week': 'int8',
+        'season': 'int16',
+        'team': 'category',
+        'team_abbr': 'category',
+        'position': 'category',
+        'status': 'category',
+        'offense_pct': 'float32'
+    }
+
+    return df.astype(
+        {
+            col: dtype.capitalize() if dtype.startswith('int') and df[col].hasnans else dtype
+            for col, dtype in dtypes.items()
+            if col in df.columns
+        }
+    )
+
 
 def create_all_dfs() -> AllDataFrames:
     """This function creates an instance of the
        AllDataFrames class, which stores all the
        data frames from all the sources.
+
+       Note: The result is cached as parquet under
+             CACHE_DIR, so only the first run downloads
+             data. Each call reads fresh data frames,
+             so callers may edit them in place.
     :return: AllDataFrames
     """
 
-    # player_id data
-    player_id_df = nfl.import_ids(
-        columns=[
-            'gsis_id',
-            'espn_id',
-            'pfr_id',
-            'name',
-            'team',
-            'position',
-            'height',
-            'weight',
-            'college',
-            'age',
-            'draft_year'
-        ]
-    )
-
-    # Filter player_id_df to positions ['QB', 'RB', 'WR', 'TE']
-    player_id_df = player_id_df[player_id_df['position'].isin(['QB', 'RB', 'WR', 'TE'])]
-
-    # Data from the weekly roster
-    weekly_roster_df = nfl.import_weekly_rosters(
-        years=[2020, 2021, 2022, 2023, 2024]
-    )
-
-    # Filter to active only and positions ['QB', 'RB', 'WR', 'TE']
-    weekly_roster_df = weekly_roster_df[weekly_roster_df['status'] == 'ACT']
-    weekly_roster_df = weekly_roster_df[weekly_roster_df['position'].isin(['QB', 'RB', 'WR', 'TE'])]
-
-    # Keep only desired columns
-    weekly_roster_df = weekly_roster_df[
-        [
-            'player_id', # Same as gsis_id
-            'position',
-            'season',
-            'week',
-            'status',
-            'years_exp'
-        ]
-    ]
-
-    # Snap Count data
-    snap_count_df = nfl.import_snap_counts(
-        years=[2020, 2021, 2022, 2023, 2024],
-    )
-
-    # Filter by position
-    snap_count_df = snap_count_df[snap_count_df['position'].isin(['QB', 'RB', 'WR', 'TE'])]
-
-    # Merge snap_counts to player_id to get gsis_id
-    snap_count_df = player_id_df.merge(
-        snap_count_df[['season', 'week', 'pfr_player_id', 'offense_snaps', 'offense_pct']],
+    # Read from the parquet cache if a previous run saved it
+    cache_paths = _all_dfs_cache_paths()
+    if all(path.exists() for path in cache_paths.values()):
+        # Parquet reads the ids back as string[python], so re-apply the Arrow-backed storage
+        return AllDataFrames(
+            **{
+                name: pd.read_parquet(path, engine='pyarrow').astype(
+                    dict.fromkeys(_ID_COLUMNS[name], 'string[pyarrow]')
+                )
+                for name, path in cache_paths.items()
+            }
+        )
+
+    # The imports are network bound, so fetch them all at once. Active status
+    # and positions ['QB', 'RB', 'WR', 'TE'] are filtered while reading the cache
+    with ThreadPoolExecutor(max_workers=7) as executor:
+        # player_id data
+        player_id_future = executor.submit(
+            cached_loader.load,
+            'ids',
+            filters=[('position', 'in', SKILL_POSITIONS)],
+            columns=[
+                'gsis_id',
+                'espn_id',
+                'pfr_id',
+                'name',
+                'team',
+                'position',
+                'height',
+                'weight',
+                'college',
+                'age',
+                'draft_year'
+            ]
+        )
+
+        # Data from the weekly roster
+        weekly_roster_future = executor.submit(
+            cached_loader.load,
+            'weekly_rosters',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            filters=[
+                ('status', '==', 'ACT'),
+                ('position', 'in', SKILL_POSITIONS)
+            ],
+            columns=[
+                'player_id', # Same as gsis_id
+                'position',
+                'season',
+                'week',
+                'status',
+                'years_exp'
+            ]
+        )
+
+        # Snap Count data (import_snap_counts has no columns argument, so the columns are picked on read)
+        snap_count_future = executor.submit(
+            cached_loader.load,
+            'snap_counts',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            filters=[('position', 'in', SKILL_POSITIONS)],
+            read_columns=[
+                'pfr_player_id',
+                'position',
+                'season',
+                'week',
+                'offense_snaps',
+                'offense_pct'
+            ]
+        )
+
+        # Weekly stats df (the sack columns feed create_passer_dfs)
+        weekly_stats_future = executor.submit(
+            cached_loader.load,
+            'weekly_data',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            filters=[('position', 'in', SKILL_POSITIONS)],
+            columns=[
+                'player_id',
+                'position',
+                'season',
+                'week',
+                'fantasy_points',
+                'fantasy_points_ppr',
+                'sacks',
+                'sack_yards',
+                'sack_fumbles',
+                'sack_fumbles_lost'
+            ],
+            downcast=True
+        )
+
+        # Next-Gen-Stats data, fetched once for create_passer_dfs, create_rusher_dfs and create_receiver_dfs
+        ngs_passing_future = executor.submit(
+            cached_loader.load,
+            'ngs_data',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            stat_type='passing'
+        )
+        ngs_rushing_future = executor.submit(
+            cached_loader.load,
+            'ngs_data',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            stat_type='rushing'
+        )
+        ngs_receiving_future = executor.submit(
+            cached_loader.load,
+            'ngs_data',
+            seasons=(2020, 2021, 2022, 2023, 2024),
+            stat_type='receiving'
+        )
+
+        player_id_df = player_id_future.result()
+        weekly_roster_df = weekly_roster_future.result()
+        snap_count_df = snap_count_future.result()
+        weekly_stats_df = weekly_stats_future.result()
+        ngs_passing_df = ngs_passing_future.result()
+        ngs_rushing_df = ngs_rushing_future.result()
+        ngs_receiving_df = ngs_receiving_future.result()
+
+    # Store repeated names as categories (carried into snap_count_df by the merge below);
+    # team and position are narrowed by normalize_dtypes
+    player_id_df = player_id_df.astype({'name': 'category'})
+
+    # Merge snap_counts to player_id to get gsis_id, using each pfr_id once so a repeated
+    # pfr_id in the ids table doesn't duplicate that player's snap rows (rows without a
+    # pfr_id are all kept)
+    snap_count_df = player_id_df[
+        player_id_df['pfr_id'].isna() | ~player_id_df.duplicated(subset='pfr_id')
+    ].merge(
+        snap_count_df.drop(columns='position'),
         left_on='pfr_id',
         right_on='pfr_player_id',
         how='left',
@@ -82,34 +247,52 @@ def create_all_dfs() -> AllDataFrames:
         ]
     ]
 
-    # Weekly stats df
-    weekly_stats_df = nfl.import_weekly_data(
-        years=[2020, 2021, 2022, 2023, 2024],
-        downcast=True
-    )
-
-    # Filter to desired positions
-    weekly_stats_df = weekly_stats_df[weekly_stats_df['position'].isin(['QB', 'RB', 'WR', 'TE'])]
-
-    # Keep only desired columns
-    weekly_stats_df = weekly_stats_df[
-        [
-            'player_id',
-            'position',
-            'season',
-            'week',
-            'fantasy_points',
-            'fantasy_points_ppr'
-        ]
-    ]
-
-    return AllDataFrames(
+    # Cast snap counts to (nullable) integers once for the data models
+    snap_count_df = snap_count_df.astype({'offense_snaps': 'Int64'})
+
+    # Store player ids as Arrow-backed strings rather than python objects
+    player_id_df = player_id_df.astype(dict.fromkeys(_ID_COLUMNS['player_id_df'], 'string[pyarrow]'))
+    weekly_roster_df = weekly_roster_df.astype(dict.fromkeys(_ID_COLUMNS['weekly_roster_df'], 'string[pyarrow]'))
+    snap_count_df = snap_count_df.astype(dict.fromkeys(_ID_COLUMNS['snap_count_df'], 'string[pyarrow]'))
+    weekly_stats_df = weekly_stats_df.astype(dict.fromkeys(_ID_COLUMNS['weekly_stats_df'], 'string[pyarrow]'))
+    ngs_passing_df = ngs_passing_df.astype(dict.fromkeys(_ID_COLUMNS['ngs_passing_df'], 'string[pyarrow]'))
+    ngs_rushing_df = ngs_rushing_df.astype(dict.fromkeys(_ID_COLUMNS['ngs_rushing_df'], 'string[pyarrow]'))
+    ngs_receiving_df = ngs_receiving_df.astype(dict.fromkeys(_ID_COLUMNS['ngs_receiving_df'], 'string[pyarrow]'))
+
+    # Narrow week/season/team/position/offense_pct dtypes (categorical position
+    # lets the filters in create_*_dfs compare integer codes)
+    player_id_df = normalize_dtypes(player_id_df)
+    weekly_roster_df = normalize_dtypes(weekly_roster_df)
+    snap_count_df = normalize_dtypes(snap_count_df)
+    weekly_stats_df = normalize_dtypes(weekly_stats_df)
+    ngs_passing_df = normalize_dtypes(ngs_passing_df)
+    ngs_rushing_df = normalize_dtypes(ngs_rushing_df)
+    ngs_receiving_df = normalize_dtypes(ngs_receiving_df)
+
+    all_data_frames = AllDataFrames(
         player_id_df=player_id_df,
         weekly_roster_df=weekly_roster_df,
         snap_count_df=snap_count_df,
         weekly_stats_df=weekly_stats_df,
+        ngs_passing_df=ngs_passing_df,
+        ngs_rushing_df=ngs_rushing_df,
+        ngs_receiving_df=ngs_receiving_df,
     )
 
+    # Save each data frame to the parquet cache for later runs, through a temporary
+    # file so an interrupted write never leaves a partial cache file
+    for name, path in cache_paths.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        getattr(all_data_frames, name).to_parquet(
+            tmp_path,
+            engine='pyarrow',
+            compression='zstd'
+        )
+        tmp_path.replace(path)
+
+    return all_data_frames
+
 
 def create_passer_dfs(
     all_data_frames: AllDataFrames,
@@ -121,12 +304,10 @@ def create_passer_dfs(
     :return: QbDataFrames
     """
 
-    # Filter player_id
+    # Filter player_id and drop columns in one pass
     player_id_df = all_data_frames.player_id_df
-    player_id_df = player_id_df[player_id_df['position'] == 'QB']
-
-    # Drop columns from player_id dataframe
-    player_id_df = player_id_df[
+    player_id_df = player_id_df.loc[
+        player_id_df['position'].values == 'QB',
         [
             'gsis_id',
             'espn_id',
@@ -142,30 +323,40 @@ def create_passer_dfs(
         ]
     ]
 
-    # Filter weekly roster
+    # Filter weekly roster and remove columns in one pass
     weekly_roster_df = all_data_frames.weekly_roster_df
-    weekly_roster_df = weekly_roster_df[weekly_roster_df['position'] == 'QB']
-
-    # Remove columns from weekly roster dataframe
-    weekly_roster_df = weekly_roster_df[
+    weekly_roster_df = weekly_roster_df.loc[
+        weekly_roster_df['position'].values == 'QB',
         [
             'player_id',
             'season',
             'week',
+            'status',
             'years_exp'
         ]
     ]
 
-    # Filter snap count
+    # Filter snap count and remove the position column in one pass
+    # (name is kept for the snap count examples)
     snap_count_df = all_data_frames.snap_count_df
-    snap_count_df = snap_count_df[snap_count_df['position'] == 'QB']
+    snap_count_df = snap_count_df.loc[
+        snap_count_df['position'].values == 'QB',
+        [
+            'gsis_id',
+            'name',
+            'season',
+            'week',
+            'offense_snaps',
+            'offense_pct'
+        ]
+    ]
 
-    # Filter weekly stats
-    weekly_stats_df = all_data_frames.weekly_stats_df
-    weekly_stats_df = weekly_stats_df[weekly_stats_df['position'] == 'QB']
+    # Filter weekly stats (also the source of the sacks data below)
+    qb_weekly_stats_df = all_data_frames.weekly_stats_df
+    qb_weekly_stats_df = qb_weekly_stats_df[qb_weekly_stats_df['position'].values == 'QB']
 
     # Remove position columns from weekly_stats_df
-    weekly_stats_df = weekly_stats_df[
+    weekly_stats_df = qb_weekly_stats_df[
         [
             'player_id',
             'season',
@@ -175,17 +366,8 @@ def create_passer_dfs(
         ]
     ]
 
-    # Sacks data
-    sacks_df = nfl.import_weekly_data(
-        years=[2020, 2021, 2022, 2023, 2024],
-        downcast=True
-    )
-
-    # QB only
-    sacks_df = sacks_df[sacks_df['position'] == 'QB']
-
-    # Keep only desired columns
-    sacks_df = sacks_df[
+    # Sacks data, from the weekly stats already loaded by create_all_dfs
+    sacks_df = qb_weekly_stats_df[
         [
             'player_id',
             'season',
@@ -197,14 +379,17 @@ def create_passer_dfs(
         ]
     ]
 
-    # Next-Gen-Stats passing data
-    ngs_passing_df = nfl.import_ngs_data(
-        stat_type='passing',
-        years=[2020, 2021, 2022, 2023, 2024],
+    # Cast sack counts to integers once for the data models
+    sacks_df = sacks_df.astype(
+        {
+            'sacks': 'Int64',
+            'sack_fumbles': 'Int64',
+            'sack_fumbles_lost': 'Int64'
+        }
     )
 
-    # Keep only desired columns
-    ngs_passing_df = ngs_passing_df[
+    # Keep only desired columns of the Next-Gen-Stats passing data
+    ngs_passing_df = all_data_frames.ngs_passing_df[
         [
             'player_gsis_id',
             'season',
@@ -230,6 +415,16 @@ def create_passer_dfs(
         ]
     ]
 
+    # Cast passing counts to integers once for the data models
+    ngs_passing_df = ngs_passing_df.astype(
+        {
+            'attempts': 'Int64',
+            'pass_touchdowns': 'Int64',
+            'interceptions': 'Int64',
+            'completions': 'Int64'
+        }
+    )
+
     return PasserDataFrames(
         player_id_df=player_id_df,
         weekly_roster_df=weekly_roster_df,
@@ -249,8 +444,10 @@ def create_rusher_dfs(
     :param all_data_frames: AllDataFrames
     :return: RbDataFrames
     """
-    # Drop columns from player_id dataframe
-    player_id_df = all_data_frames.player_id_df[
+    # Filter player_id_df to desired positions and drop columns in one pass
+    player_id_df = all_data_frames.player_id_df
+    player_id_df = player_id_df.loc[
+        player_id_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'gsis_id',
             'espn_id',
@@ -265,11 +462,11 @@ def create_rusher_dfs(
             'draft_year'
         ]
     ]
-    # Filter player_id_df to desired positions
-    player_id_df = player_id_df[player_id_df['position'].isin(['RB', 'WR', 'TE'])]
 
-    # Remove columns from weekly roster dataframe
-    weekly_roster_df = all_data_frames.weekly_roster_df[
+    # Filter weekly_roster_df to desired positions and remove columns in one pass
+    weekly_roster_df = all_data_frames.weekly_roster_df
+    weekly_roster_df = weekly_roster_df.loc[
+        weekly_roster_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_id',
             'season',
@@ -277,11 +474,11 @@ def create_rusher_dfs(
             'years_exp'
         ]
     ]
-    # Filter weekly_roster_df to desired positions
-    weekly_roster_df = weekly_roster_df[weekly_roster_df['position'].isin(['RB', 'WR', 'TE'])]
 
-    # Remove position columns from weekly_stats_df
-    weekly_stats_df = all_data_frames.weekly_stats_df[
+    # Filter weekly_stats_df to desired positions and remove columns in one pass
+    weekly_stats_df = all_data_frames.weekly_stats_df
+    weekly_stats_df = weekly_stats_df.loc[
+        weekly_stats_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_id',
             'season',
@@ -290,23 +487,17 @@ def create_rusher_dfs(
             'fantasy_points_ppr'
         ]
     ]
-    # Filter weekly_stats_df to desired positions
-    weekly_stats_df = weekly_stats_df[weekly_stats_df['position'].isin(['RB', 'WR', 'TE'])]
 
     # Filter snap count dataframe to desired positions
     snap_count_df = all_data_frames.snap_count_df
-    snap_count_df = snap_count_df[snap_count_df['position'].isin(['RB', 'WR', 'TE'])]
+    snap_count_df = snap_count_df[snap_count_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values]
 
     # Next-Gen-Stats rushing data
-    ngs_rushing_df = nfl.import_ngs_data(
-        stat_type='rushing',
-        years=[2020, 2021, 2022, 2023, 2024],
-    )
-    # Filter ngs_rushing_df to desired positions
-    ngs_rushing_df = ngs_rushing_df[ngs_rushing_df['position'].isin(['RB', 'WR', 'TE'])]
+    ngs_rushing_df = all_data_frames.ngs_rushing_df
 
-    # Keep only desired columns
-    ngs_rushing_df = ngs_rushing_df[
+    # Filter ngs_rushing_df to desired positions and keep only desired columns in one pass
+    ngs_rushing_df = ngs_rushing_df.loc[
+        ngs_rushing_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_gsis_id',
             'season',
@@ -325,6 +516,15 @@ def create_rusher_dfs(
         ]
     ]
 
+    # Cast rushing counts to integers once for the data models
+    ngs_rushing_df = ngs_rushing_df.astype(
+        {
+            'rush_attempts': 'Int64',
+            'rush_yards': 'Int64',
+            'rush_touchdowns': 'Int64'
+        }
+    )
+
     return RusherDataFrames(
         player_id_df=player_id_df,
         weekly_roster_df=weekly_roster_df,
@@ -343,8 +543,10 @@ def create_receiver_dfs(
     :param all_data_frames: AllDataFrames
     :return: WrDataFrames
     """
-    # Drop columns from player_id dataframe
-    player_id_df = all_data_frames.player_id_df[
+    # Filter player_id_df to desired positions and drop columns in one pass
+    player_id_df = all_data_frames.player_id_df
+    player_id_df = player_id_df.loc[
+        player_id_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'gsis_id',
             'espn_id',
@@ -359,11 +561,11 @@ def create_receiver_dfs(
             'draft_year'
         ]
     ]
-    # Filter player_id_df to desired positions
-    player_id_df = player_id_df[player_id_df['position'].isin(['RB', 'WR', 'TE'])]
 
-    # Remove columns from weekly roster dataframe
-    weekly_roster_df = all_data_frames.weekly_roster_df[
+    # Filter weekly_roster_df to desired positions and remove columns in one pass
+    weekly_roster_df = all_data_frames.weekly_roster_df
+    weekly_roster_df = weekly_roster_df.loc[
+        weekly_roster_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_id',
             'season',
@@ -371,11 +573,11 @@ def create_receiver_dfs(
             'years_exp'
         ]
     ]
-    # Filter weekly_roster_df to desired positions
-    weekly_roster_df = weekly_roster_df[weekly_roster_df['position'].isin(['RB', 'WR', 'TE'])]
 
-    # Remove position columns from weekly_stats_df
-    weekly_stats_df = all_data_frames.weekly_stats_df[
+    # Filter weekly_stats_df to desired positions and remove columns in one pass
+    weekly_stats_df = all_data_frames.weekly_stats_df
+    weekly_stats_df = weekly_stats_df.loc[
+        weekly_stats_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_id',
             'season',
@@ -384,23 +586,17 @@ def create_receiver_dfs(
             'fantasy_points_ppr'
         ]
     ]
-    # Filter weekly_roster_df to desired positions
-    weekly_stats_df = weekly_stats_df[weekly_stats_df['position'].isin(['RB', 'WR', 'TE'])]
 
     # Filter snap count dataframe to desired positions
     snap_count_df = all_data_frames.snap_count_df
-    snap_count_df = snap_count_df[snap_count_df['position'].isin(['RB', 'WR', 'TE'])]
+    snap_count_df = snap_count_df[snap_count_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values]
 
-    # Next-Gen-Stats rushing data
-    ngs_receiving_df = nfl.import_ngs_data(
-        stat_type='rushing',
-        years=[2020, 2021, 2022, 2023, 2024],
-    )
-    # Filter ngs_receiving_df to desired positions
-    ngs_receiving_df = ngs_receiving_df[ngs_receiving_df['position'].isin(['RB', 'WR', 'TE'])]
+    # Next-Gen-Stats receiving data
+    ngs_receiving_df = all_data_frames.ngs_receiving_df
 
-    # Keep only desired columns
-    ngs_receiving_df = ngs_receiving_df[
+    # Filter ngs_receiving_df to desired positions and keep only desired columns in one pass
+    ngs_receiving_df = ngs_receiving_df.loc[
+        ngs_receiving_df['position'].isin(RUSHER_RECEIVER_POSITIONS).values,
         [
             'player_gsis_id',
             'season',
@@ -420,6 +616,16 @@ def create_receiver_dfs(
         ]
     ]
 
+    # Cast receiving counts to integers once for the data models
+    ngs_receiving_df = ngs_receiving_df.astype(
+        {
+            'receptions': 'Int64',
+            'targets': 'Int64',
+            'yards': 'Int64',
+            'rec_touchdowns': 'Int64'
+        }
+    )
+
     return ReceiverDataFrames(
         player_id_df=player_id_df,
         weekly_roster_df=weekly_roster_df,
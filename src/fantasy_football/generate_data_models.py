@@ -1,6 +1,8 @@
+import logging
 from typing import List
 
-from pandas import Series
+import pandas as pd
+from pandas import DataFrame
 
 from fantasy_football.data.data_model.player import Player
 from fantasy_football.data.named_tuple.all_data_frames import AllDataFrames
@@ -10,76 +12,107 @@ from fantasy_football.generate_data_frames import (
     create_passer_dfs,
 )
 
+logger = logging.getLogger(__name__)
 
-def create_data_models():
+
+def create_data_models() -> List[Player]:
     """This function is kinda like your main
        function, at least for now. It calls
        everything to generate the data models.
 
-       I left the return type as undefined due to this
-       not sure where your going with it
+       Note: QB weeks missing any Player field
+             (e.g. no espn_id or college in the
+             ids table) are logged and skipped.
+    :return: List of Player instances, one per QB and week
     """
 
-    # Create all the dataframes from all sources.
-    all_data_frames: AllDataFrames = create_all_dfs()
-
-    # Filter down the dataframes to just the QBs.
-    qb_data_frames: PasserDataFrames = create_passer_dfs(
-        all_data_frames=all_data_frames,
-    )
-
-    # Everything except snap_count uses gsis_id
-    player_ids: List[str] = all_data_frames.player_id_df['gsis_id'].tolist()
-
-    # Create a list to store the QB data models.
-    qb_data_models: List[Player] = []
-
-    # Loop over all the names.
-    player_id: str
-    for player_id in player_ids:
-        # Player_id dataframe
-        player_id_df: Series = qb_data_frames.player_id_df[
-            qb_data_frames.player_id_df['gsis_id'] == player_id
-        ]
-
-        # Weekly Roster dataframe
-        filter_qb_df_2: Series = filter_qb_df_2[
-            filter_qb_df_2['player_id'] == player_id
-        ]
+    # Share buffers between the filtered/projected frames until something writes to them,
+    # instead of copying on every df = df[...] step. Scoped to this entry point so importing
+    # the package doesn't change pandas' behaviour for other code.
+    with pd.option_context('mode.copy_on_write', True):
+        # Create all the dataframes from all sources.
+        all_data_frames: AllDataFrames = create_all_dfs()
 
-        # Snap Counts dataframe
-        filter_qb_df_3: Series = filter_qb_df_3[
-            filter_qb_df_3['player_id'] == player_id
-        ]
-
-        # Weekly Stats Dataframe
-        filter_qb_df_4: Series = filter_qb_df_4[
-            filter_qb_df_4['player_id'] == player_id
-        ]
+        # Filter down the dataframes to just the QBs.
+        qb_data_frames: PasserDataFrames = create_passer_dfs(
+            all_data_frames=all_data_frames,
+        )
 
-        # Sacks df
-        filter_qb_df_5: Series = filter_qb_df_5[
-            filter_qb_df_5['player_id'] == player_id
-        ]
+        # Keep only the player id columns Player uses, so the joins carry no extra columns,
+        # and each gsis_id once without missing ids, so every player yields one row per week.
+        # (create_passer_dfs has already filtered every dataframe to QBs.)
+        player_id_df: DataFrame = qb_data_frames.player_id_df[
+            [
+                'gsis_id',
+                'espn_id',
+                'pfr_id',
+                'name',
+                'team',
+                'position',
+                'height',
+                'weight',
+                'college',
+                'age'
+            ]
+        ].dropna(
+            subset=['gsis_id']
+        ).drop_duplicates(
+            subset='gsis_id'
+        )
 
-        # Next-gen-stats dataframe
-        filter_qb_df_6: Series = filter_qb_df_6[
-            filter_qb_df_6['player_id'] == player_id
-        ]
+        # snap_count_df comes from a left merge onto the ids, so players without snaps have
+        # NA season/week (stored as nullable Int16/Int8). Those rows can never match the
+        # inner join below, so drop them and cast the keys back to the roster's int16/int8.
+        # Keep one row per player and week in case the ids table repeats a gsis_id under
+        # different pfr_ids. name is left out, player_id_df already has it.
+        snap_count_df: DataFrame = qb_data_frames.snap_count_df[
+            [
+                'gsis_id',
+                'season',
+                'week',
+                'offense_snaps',
+                'offense_pct'
+            ]
+        ].dropna(
+            subset=['season', 'week']
+        ).drop_duplicates(
+            subset=['gsis_id', 'season', 'week']
+        ).astype(
+            {
+                'season': 'int16',
+                'week': 'int8'
+            }
+        )
 
+        # Join the QB weekly data onto the player ids in one pass, one row per player and week.
+        # Everything except snap_count calls gsis_id player_id.
+        qb_df: DataFrame = player_id_df.merge(
+            qb_data_frames.weekly_roster_df.rename(columns={'player_id': 'gsis_id'}),
+            on='gsis_id',
+            how='inner'
+        ).merge(
+            snap_count_df,
+            on=['gsis_id', 'season', 'week'],
+            how='inner'
+        ).merge(
+            qb_data_frames.weekly_stats_df.rename(columns={'player_id': 'gsis_id'}),
+            on=['gsis_id', 'season', 'week'],
+            how='inner'
+        )
 
+        # One missing value fails the whole batched validation, so skip the rows
+        # missing any Player field (e.g. no espn_id, college or age in the ids table).
+        missing_fields = qb_df[list(Player.model_fields)].isna().any(axis=1)
+        if missing_fields.any():
+            logger.warning(
+                f"Skipping {missing_fields.sum()} QB rows with missing Player fields for "
+                f"gsis_ids {qb_df.loc[missing_fields, 'gsis_id'].unique().tolist()}"
+            )
+            qb_df = qb_df[~missing_fields]
 
-        # Call the class method here.
-        qb_data_models.append(
-            Player.create_from_qb_series(
-                player_id_df=player_id_df,
-                filter_qb_df_2=filter_qb_df_2,
-                filter_qb_df_3=filter_qb_df_3,
-                filter_qb_df_4=filter_qb_df_4,
-                filter_qb_df_5=filter_qb_df_5,
-                filter_qb_df_6=filter_qb_df_6
-            ),
-        )
+        # Create the QB data models in one batched validation pass.
+        qb_data_models: List[Player] = Player.create_from_df(qb_df)
 
+        # Todo: Add Similar code for each position.
 
-    # Todo: Add Similar code for each position.
+    return qb_data_models
@@ -1,23 +1,38 @@
 """Load dataframe with quarterback and related data.
 
 """
-import nfl_data_py as nfl
+from typing import (
+    List,
+    Tuple
+)
 
-from typing import List
+import pandas as pd
 
-def load_weekly_qb_data(
-        years: List[int],
-):
-    columns =[
-        'player_id',
-        'position',
-        'fantasy_points',
-        'fantasy_points_ppr',
-        'season_type',
+from fantasy_football import cached_loader
+
+# Weekly data columns kept for quarterbacks
+COLUMNS: Tuple[str, ...] = (
+    'player_id',
+    'position',
+    'fantasy_points',
+    'fantasy_points_ppr',
+    'season_type',
+)
 
-    ]
 
-    df = nfl.import_weekly_data(
-        years=years,
-        columns
-    )
\ No newline at end of file
+def load_weekly_qb_data(
+        years: List[int],
+) -> pd.DataFrame:
+    """This function loads the weekly data for
+       quarterbacks, reading only COLUMNS. Repeat
+       calls read the local parquet cache.
+    :param years: Seasons to load
+    :return: DataFrame with one row per QB and week
+    """
+    return cached_loader.load(
+        'weekly_data',
+        seasons=tuple(years),
+        filters=[('position', '==', 'QB')],
+        columns=list(COLUMNS),
+        downcast=True
+    )
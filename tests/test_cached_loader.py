@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from fantasy_football import cached_loader
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a temporary directory."""
+    monkeypatch.setattr(cached_loader, 'CACHE_DIR', tmp_path)
+    return tmp_path
+
+
+def test_cache_path_is_stable(cache_dir):
+    first = cached_loader._cache_path('weekly_data', (2023, 2024), {'columns': ['player_id', 'week']})
+    second = cached_loader._cache_path('weekly_data', (2023, 2024), {'columns': ['player_id', 'week']})
+
+    assert first == second
+    assert first.parent == cache_dir / 'raw'
+    assert first.name.startswith('weekly_data_')
+
+
+def test_cache_path_ignores_argument_and_column_order(cache_dir):
+    path = cached_loader._cache_path(
+        'weekly_data',
+        (2024,),
+        {'columns': ['player_id', 'week'], 'downcast': True}
+    )
+
+    assert path == cached_loader._cache_path(
+        'weekly_data',
+        (2024,),
+        {'downcast': True, 'columns': ['week', 'player_id']}
+    )
+
+
+def test_cache_path_differs_by_arguments(cache_dir):
+    path = cached_loader._cache_path('ngs_data', (2024,), {'stat_type': 'passing'})
+
+    assert path != cached_loader._cache_path('ngs_data', (2024,), {'stat_type': 'rushing'})
+    assert path != cached_loader._cache_path('ngs_data', (2023,), {'stat_type': 'passing'})
+
+
+def test_load_reads_filtered_columns_from_cache(cache_dir, monkeypatch):
+    path = cached_loader._cache_path('snap_counts', (2024,), {})
+    path.parent.mkdir(parents=True)
+    pd.DataFrame(
+        {
+            'pfr_player_id': ['AaaA00', 'BbbB00', 'CccC00'],
+            'position': ['QB', 'RB', 'K'],
+            'offense_snaps': [60, 40, 0]
+        }
+    ).to_parquet(path, engine='pyarrow')
+
+    # A cached import is never downloaded again
+    monkeypatch.setattr(cached_loader, '_download', pytest.fail)
+
+    df = cached_loader.load(
+        'snap_counts',
+        seasons=(2024,),
+        filters=[('position', 'in', ['QB', 'RB'])],
+        read_columns=['pfr_player_id', 'offense_snaps']
+    )
+
+    assert df.columns.tolist() == ['pfr_player_id', 'offense_snaps']
+    assert df['pfr_player_id'].tolist() == ['AaaA00', 'BbbB00']
+
+
+def test_load_downloads_once_in_requested_column_order(cache_dir, monkeypatch):
+    calls = []
+
+    def import_ids(columns):
+        calls.append(columns)
+        return pd.DataFrame({'gsis_id': ['00-0000001'], 'name': ['A']})[columns]
+
+    monkeypatch.setattr(cached_loader.nfl, 'import_ids', import_ids, raising=False)
+
+    first = cached_loader.load('ids', columns=['gsis_id', 'name'])
+    second = cached_loader.load('ids', columns=['name', 'gsis_id'])
+
+    assert len(calls) == 1
+    assert first.columns.tolist() == ['gsis_id', 'name']
+    assert second.columns.tolist() == ['name', 'gsis_id']
+    assert not list(cache_dir.glob('raw/*.tmp'))
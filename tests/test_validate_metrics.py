@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+from pydantic import (
+    BaseModel,
+    Field
+)
+
+from fantasy_football.data.data_model.validate_metrics import check_bounds
+
+
+class _Metrics(BaseModel):
+    week: int = Field(ge=0, le=22)
+    avg_cushion: float = Field(gt=0)
+    team_abbr: str = Field(min_length=2)
+
+
+def test_check_bounds_accepts_values_in_range():
+    df = pd.DataFrame(
+        {
+            'week': [0, 22],
+            'avg_cushion': [0.5, 7.0],
+            'team_abbr': ['KC', 'BUF'],
+            'extra': [-1, -1]
+        }
+    )
+
+    check_bounds(df, _Metrics)
+
+
+def test_check_bounds_names_the_first_bad_row():
+    df = pd.DataFrame(
+        {
+            'week': [1, 23, 30],
+            'avg_cushion': [1.0, 1.0, 1.0]
+        },
+        index=[10, 11, 12]
+    )
+
+    with pytest.raises(ValueError, match=r'week 23\.0 at row 11 does not satisfy le=22'):
+        check_bounds(df, _Metrics)
+
+
+def test_check_bounds_rejects_missing_values():
+    df = pd.DataFrame({'avg_cushion': pd.array([1.0, None], dtype='Float64')})
+
+    with pytest.raises(ValueError, match='at row 1'):
+        check_bounds(df, _Metrics)